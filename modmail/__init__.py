@@ -1,9 +1,11 @@
 import asyncio
+import atexit
 import logging
 import logging.handlers
 import os
-
-import coloredlogs
+import queue
+import sys
+import typing as t
 
 from modmail import log
 
@@ -24,47 +26,79 @@ if os.name == "nt":
 LOG_FILE_SIZE = 8 * (2**10) ** 2  # 8MB, discord upload limit
 
 
-ROOT_LOG_LEVEL = log.get_logging_level()
 FMT = "%(asctime)s %(levelname)10s %(name)15s - [%(lineno)5d]: %(message)s"
 DATEFMT = "%Y/%m/%d %H:%M:%S"
 
 logging.setLoggerClass(log.ModmailLogger)
 
-# Set up file logging relative to the current path
-log_file = log.get_log_dir() / "bot.log"
-log_file.parent.mkdir(parents=True, exist_ok=True)
-
-# file handler
-file_handler = logging.handlers.RotatingFileHandler(
-    log_file,
-    maxBytes=LOG_FILE_SIZE,
-    backupCount=7,
-    encoding="utf-8",
-)
-
-file_handler.setFormatter(
-    logging.Formatter(
-        fmt=FMT,
-        datefmt=DATEFMT,
-    )
-)
+log_listener: t.Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    """Stop the log listener at exit, unless it has already been stopped."""
+    # QueueListener.stop can't be called twice, as it sets its thread to None
+    if log_listener is not None and log_listener._thread is not None:
+        log_listener.stop()
 
-file_handler.setLevel(logging.TRACE)
 
-coloredlogs.DEFAULT_LEVEL_STYLES["trace"] = coloredlogs.DEFAULT_LEVEL_STYLES["spam"]
+def configure_logging() -> None:
+    """
+    Set up the root logger with the console and file handlers.
 
-coloredlogs.install(level=logging.TRACE, fmt=FMT, datefmt=DATEFMT)
+    This is not done on import, so scripts which only need part of modmail don't pay for it.
+    Calling this more than once does nothing.
+    """
+    global log_listener
+    if log_listener is not None:
+        return
 
-# Create root logger
-root: log.ModmailLogger = logging.getLogger()
-root.setLevel(ROOT_LOG_LEVEL)
-root.addHandler(file_handler)
+    # Set up file logging relative to the current path
+    log_file = log.get_log_dir() / "bot.log"
+    log_file.parent.mkdir(parents=True, exist_ok=True)
 
-# Silence irrelevant loggers
-logging.getLogger("discord").setLevel(logging.WARNING)
-logging.getLogger("websockets").setLevel(logging.ERROR)
-# Set asyncio logging back to the default of INFO even if asyncio's debug mode is enabled.
-logging.getLogger("asyncio").setLevel(logging.INFO)
+    # file handler
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=LOG_FILE_SIZE,
+        backupCount=7,
+        encoding="utf-8",
+    )
+
+    file_handler.setFormatter(
+        logging.Formatter(
+            fmt=FMT,
+            datefmt=DATEFMT,
+        )
+    )
 
-# set up trace loggers
-log.set_logger_levels()
+    file_handler.setLevel(logging.TRACE)
+
+    # stream handler, only coloured if the output is a terminal
+    stream_handler = log.StderrHandler(logging.TRACE)
+    if sys.stderr.isatty():
+        stream_handler.setFormatter(log.ColourFormatter(fmt=FMT, datefmt=DATEFMT))
+    else:
+        stream_handler.setFormatter(logging.Formatter(fmt=FMT, datefmt=DATEFMT))
+
+    # Create root logger
+    root: log.ModmailLogger = logging.getLogger()
+    root.setLevel(log.get_logging_level())
+    root.addHandler(stream_handler)
+
+    # the file handler is run by a listener thread, so disk writes and rollovers
+    # do not block the event loop. Records are handed over through a queue.
+    # the stream handler is kept synchronous to keep console output in order with any prints
+    log_queue = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    log_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(_stop_log_listener)
+
+    # Silence irrelevant loggers
+    logging.getLogger("discord").setLevel(logging.WARNING)
+    logging.getLogger("websockets").setLevel(logging.ERROR)
+    # Set asyncio logging back to the default of INFO even if asyncio's debug mode is enabled.
+    logging.getLogger("asyncio").setLevel(logging.INFO)
+
+    # set up trace loggers
+    log.set_logger_levels()
@@ -1,8 +1,14 @@
 import logging
 
-from modmail.bot import ModmailBot
-from modmail.log import ModmailLogger
-from modmail.utils.embeds import patch_embed
+from modmail import configure_logging
+
+
+# logging is configured before importing the rest of the bot, so logs emitted on import are kept
+configure_logging()
+
+from modmail.bot import ModmailBot  # noqa: E402
+from modmail.log import ModmailLogger  # noqa: E402
+from modmail.utils.embeds import patch_embed  # noqa: E402
 
 
 try:
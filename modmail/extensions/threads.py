@@ -333,8 +333,9 @@ class TicketsCog(ModmailCog, name="Threads"):
                 everyone=False, users=False, roles=True, replied_user=False
             )
         # TODO: !CONFIG add to configuration system.
-        if self.bot.config.user.threads.thread_mention_role_id is not None:
-            mention = f"<@&{self.bot.config.user.threads.thread_mention_role_id}>"
+        mention_role_id = self.bot.config.user.threads.thread_mention_role_id
+        if mention_role_id is not None:
+            mention = f"<@&{mention_role_id}>"
         else:
             mention = "@here"
 
@@ -833,12 +834,15 @@ class TicketsCog(ModmailCog, name="Threads"):
     @ModmailCog.listener(name="on_message")
     async def on_dm_message(self, message: discord.Message) -> None:
         """Relay all dms to a thread channel."""
-        author = message.author
-
-        if author.id == self.bot.user.id:
+        # this listener receives every message the bot can see, so
+        # the cheapest check, which filters out all guild messages, goes first
+        if message.guild:
             return
 
-        if message.guild:
+        author = message.author
+        bot_user = self.bot.user
+
+        if author.id == bot_user.id:
             return
 
         ticket = await self.fetch_ticket(author.id)
@@ -860,7 +864,7 @@ class TicketsCog(ModmailCog, name="Threads"):
                         embeds=[
                             Embed(
                                 title="Ticket Opened",
-                                description=f"Thanks for dming {self.bot.user.name}! "
+                                description=f"Thanks for dming {bot_user.name}! "
                                 "A member of our staff will be with you shortly!",
                                 timestamp=message.created_at,
                             )
@@ -1,7 +1,8 @@
 import functools
 import logging
 import pathlib
-from typing import Any, Dict, Union
+import sys
+from typing import Any, Dict, NoReturn, Union
 
 
 __all__ = [
@@ -9,6 +10,8 @@ __all__ = [
     "get_logging_level",
     "set_logger_levels",
     "ModmailLogger",
+    "ColourFormatter",
+    "StderrHandler",
 ]
 
 logging.TRACE = 5
@@ -142,3 +145,46 @@ class ModmailLogger(logging.Logger):
         logger.notice("Houston, we have a %s", "not-quite-a-warning problem", exc_info=1)
         """
         self.log(logging.NOTICE, msg, *args, **kwargs)
+
+
+class ColourFormatter(logging.Formatter):
+    """Formatter which colours the whole record with ANSI escape codes, depending on its level."""
+
+    LEVEL_COLOURS: Dict[int, str] = {
+        logging.TRACE: "\x1b[90m",
+        logging.DEBUG: "\x1b[36m",
+        logging.INFO: "\x1b[32m",
+        logging.NOTICE: "\x1b[94m",
+        logging.WARNING: "\x1b[33m",
+        logging.ERROR: "\x1b[31m",
+        logging.CRITICAL: "\x1b[1;31m",
+    }
+    RESET = "\x1b[0m"
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record, wrapping it in the colour of its level."""
+        colour = self.LEVEL_COLOURS.get(record.levelno)
+        if colour is None:
+            return super().format(record)
+        return colour + super().format(record) + self.RESET
+
+
+class StderrHandler(logging.StreamHandler):
+    """
+    Stream handler which always writes to the current `sys.stderr`.
+
+    Unlike a normal StreamHandler the stream is not bound when the handler is created,
+    so redirecting `sys.stderr` (eg with `contextlib.redirect_stderr`) also redirects the logs.
+    """
+
+    def __init__(self, level: int = logging.NOTSET):
+        logging.Handler.__init__(self, level)
+
+    @property
+    def stream(self) -> Any:
+        """Return the current standard error stream."""
+        return sys.stderr
+
+    def setStream(self, stream: Any) -> NoReturn:  # noqa: N802
+        """The stream of this handler is always `sys.stderr`, so it cannot be set."""
+        raise NotImplementedError(f"{type(self).__name__} always writes to sys.stderr.")
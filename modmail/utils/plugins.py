@@ -8,59 +8,128 @@ TODO: Expand file to download plugins from github and gitlab from a list that is
 """
 
 
-import glob
 import importlib
 import importlib.util
 import inspect
 import logging
+import os
 import typing as t
 from pathlib import Path
 
 from modmail import plugins
 from modmail.log import ModmailLogger
 from modmail.utils.cogs import ExtMetadata
-from modmail.utils.extensions import BOT_MODE, unqualify
+from modmail.utils.extensions import BOT_MODE
 
 
 log: ModmailLogger = logging.getLogger(__name__)
 
 
 BASE_PATH = Path(plugins.__file__).parent.resolve()
+BASE_STR = str(BASE_PATH)
 PLUGIN_MODULE = "modmail.plugins"
+PLUGIN_PREFIX = PLUGIN_MODULE + "."
 PLUGINS: t.Dict[str, t.Tuple[bool, bool]] = dict()
 
+# cache of the results of walking the plugin files, to avoid re-executing unchanged plugins
+# key: file path, value: (mtime_ns, size, result)
+_WALK_CACHE: t.Dict[str, t.Tuple[int, int, t.Optional[t.Tuple[str, bool]]]] = dict()
+
+
+def _scan(path: str) -> t.Iterator[os.DirEntry]:
+    """
+    Recursively yield the python files within `path`.
+
+    Names starting with an underscore or a dot are skipped, which prunes directories
+    such as `__pycache__` and `.git`, as well as editor temporary files like `.#plugin.py`.
+    """
+    # directories which cannot be read, such as symlink loops or folders
+    # removed during the walk, are skipped rather than stopping the whole walk.
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name.startswith(("_", ".")):
+                    continue
+                # symlinks are followed on purpose, as linked plugin folders
+                # are important for ease of development.
+                if entry.is_dir():
+                    yield from _scan(entry.path)
+                elif entry.name.endswith(".py") and entry.is_file():
+                    yield entry
+    except OSError:
+        log.warning("Unable to scan {0} for plugins, skipping it.".format(path), exc_info=True)
+
+
+def _import_plugin(name: str, path: str) -> t.Optional[t.Tuple[str, bool]]:
+    """
+    Import the plugin module `name` located at `path`.
+
+    Returns the module name and whether it should be loaded, or None if the module is not a plugin.
+    """
+    # load the plugins using importlib
+    # this needs to be done like this, due to the fact that
+    # its possible a plugin will not have an __init__.py file
+    spec = importlib.util.spec_from_file_location(name, path)
+    imported = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(imported)
+
+    if not inspect.isfunction(getattr(imported, "setup", None)):
+        # If it lacks a setup function, it's not a plugin. This is enforced by dpy.
+        log.trace("{0} does not have a setup function. Skipping.".format(name))
+        return None
+
+    ext_metadata: ExtMetadata = getattr(imported, "EXT_METADATA", None)
+    if ext_metadata is not None:
+        # check if this plugin is dev only or plugin dev only
+        load_cog = bool(int(ext_metadata.load_if_mode) & BOT_MODE)
+        log.trace(f"Load plugin {imported.__name__!r}?: {load_cog}")
+        return imported.__name__, load_cog
+
+    log.info(
+        f"Plugin {imported.__name__!r} is missing a EXT_METADATA variable. Assuming its a normal plugin."
+    )
+
+    # Presume Production Mode/Metadata defaults if metadata var does not exist.
+    return imported.__name__, ExtMetadata.load_if_mode
+
 
 def walk_plugins() -> t.Iterator[t.Tuple[str, bool]]:
-    """Yield plugin names from the modmail.plugins subpackage."""
+    """
+    Yield plugin names from the modmail.plugins subpackage.
+
+    Files which have not changed since the last walk are not imported again.
+    """
+    seen: t.Set[str] = set()
     # walk all files in the plugins folder
     # this is to ensure folder symlinks are supported,
     # which are important for ease of development.
     # NOTE: We are not using Pathlib's glob utility as it doesn't
     #   support following symlinks, see: https://bugs.python.org/issue33428
-    for path in glob.iglob(f"{BASE_PATH}/**/*.py", recursive=True):
-
+    for entry in _scan(BASE_STR):
+        path = entry.path
         log.trace("Path: {0}".format(path))
+        seen.add(path)
+
+        st = entry.stat()
+        cached = _WALK_CACHE.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            log.trace("{0} is unchanged, using the cached result.".format(path))
+            if cached[2] is not None:
+                yield cached[2]
+            continue
 
         # calculate the module name, dervived from the relative path
-        relative_path = Path(path).relative_to(BASE_PATH)
-        name = relative_path.__str__().rstrip(".py").replace("/", ".")
-        name = PLUGIN_MODULE + "." + name
+        # the path always starts with the base path, and ends with ".py"
+        name = PLUGIN_PREFIX + path[len(BASE_STR) + 1 : -3].replace(os.sep, ".")
         log.trace("Module name: {0}".format(name))
 
-        if unqualify(name.split(".")[-1]).startswith("_"):
-            # Ignore module/package names starting with an underscore.
-            continue
-
         # due to the fact that plugins are user generated and may not have gone through
         # the testing that the bot has, we want to ensure we try/except any plugins
         # that fail to import.
+        # NOTE: plugins must be imported on the calling thread, as their top level code
+        # may rely on the running event loop, eg `asyncio.get_event_loop()`
         try:
-            # load the plugins using importlib
-            # this needs to be done like this, due to the fact that
-            # its possible a plugin will not have an __init__.py file
-            spec = importlib.util.spec_from_file_location(name, path)
-            imported = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(imported)
+            result = _import_plugin(name, path)
         except Exception:
             log.error(
                 "Failed to import {0}. As a result, this plugin is not considered installed.".format(name),
@@ -68,22 +137,10 @@ def walk_plugins() -> t.Iterator[t.Tuple[str, bool]]:
             )
             continue
 
-        if not inspect.isfunction(getattr(imported, "setup", None)):
-            # If it lacks a setup function, it's not a plugin. This is enforced by dpy.
-            log.trace("{0} does not have a setup function. Skipping.".format(name))
-            continue
-
-        ext_metadata: ExtMetadata = getattr(imported, "EXT_METADATA", None)
-        if ext_metadata is not None:
-            # check if this plugin is dev only or plugin dev only
-            load_cog = bool(int(ext_metadata.load_if_mode) & BOT_MODE)
-            log.trace(f"Load plugin {imported.__name__!r}?: {load_cog}")
-            yield imported.__name__, load_cog
-            continue
-
-        log.info(
-            f"Plugin {imported.__name__!r} is missing a EXT_METADATA variable. Assuming its a normal plugin."
-        )
+        _WALK_CACHE[path] = (st.st_mtime_ns, st.st_size, result)
+        if result is not None:
+            yield result
 
-        # Presume Production Mode/Metadata defaults if metadata var does not exist.
-        yield imported.__name__, ExtMetadata.load_if_mode
+    # forget any files which no longer exist
+    for path in _WALK_CACHE.keys() - seen:
+        del _WALK_CACHE[path]
@@ -11,15 +11,19 @@ import pathlib
 import sys
 import textwrap
 import typing
-from collections import defaultdict
 
 import atoml
 import attr
 import click
-import dotenv
 import yaml
 
 
+try:
+    # use the libyaml bindings if available, which are much faster than the pure python dumper
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 try:
     import pygments
 except ModuleNotFoundError:
@@ -117,21 +121,17 @@ def export_default_conf() -> int:
     # This is the only place where the order of the config should matter, when exporting in a specific style
     def sort_dict(d: dict) -> dict:
         """Takes a dict and sorts it, recursively."""
-        sorted_dict = {x[0]: x[1] for x in sorted(d.items(), key=lambda e: e[0])}
-
-        for k, v in d.items():
-            if not isinstance(v, dict):
-                continue
-            sorted_dict[k] = sort_dict(v)
-
-        return sorted_dict
+        return {
+            k: sort_dict(v) if isinstance(v, dict) else v for k, v in sorted(d.items(), key=lambda e: e[0])
+        }
 
     dump = sort_dict(dump)
     doc = atoml.document()
     doc.update(dump)
 
-    toml_file = MODMAIL_CONFIG_DIR / (modmail.config.AUTO_GEN_FILE_NAME + ".toml")
-    yaml_file = MODMAIL_CONFIG_DIR / (modmail.config.AUTO_GEN_FILE_NAME + ".yaml")
+    file_name = modmail.config.AUTO_GEN_FILE_NAME
+    toml_file = MODMAIL_CONFIG_DIR / (file_name + ".toml")
+    yaml_file = MODMAIL_CONFIG_DIR / (file_name + ".yaml")
 
     with DidFileEdit(toml_file, yaml_file) as check_file:
         with open(toml_file, "w") as f:
@@ -141,7 +141,7 @@ def export_default_conf() -> int:
 
         with open(yaml_file, "w") as f:
             f.write(MESSAGE.format(file_type="YAML"))
-            yaml.dump(dump, f, indent=4, Dumper=yaml.SafeDumper)
+            yaml.dump(dump, f, indent=4, Dumper=SafeDumper)
 
     for file, diff in check_file.edited_files.items():
         print(
@@ -206,48 +206,35 @@ def export_env_and_app_json_conf() -> int:
                 )
                 raise e
 
-        # dotenv modifies currently existing files, but we want to erase the current file
-        # to ensure that there are no extra environment variables
-        ENV_EXPORT_FILE.unlink(missing_ok=True)
-        ENV_EXPORT_FILE.touch()
-
         exported = get_env_vars(type(default))
 
+        env_lines: typing.List[str] = list()
         app_json_env = dict()
 
         for key, meta in exported.items():
+            meta_tbl = meta[METADATA_TABLE]
+            required = meta.get("required", False)
             # if the value is required, or explicity asks to be exported, then we want to export it
-            if meta[METADATA_TABLE].export_to_env_template or meta.get("required", False):
-
-                dotenv.set_key(
-                    ENV_EXPORT_FILE,
-                    key,
-                    meta[METADATA_TABLE].export_environment_prefill or meta["default"],
-                )
-
-            if (
-                meta[METADATA_TABLE].export_to_app_json
-                or meta[METADATA_TABLE].export_to_env_template
-                or meta.get("required", False)
-            ):
-                description = (
-                    f"{meta[METADATA_TABLE].description}\n{meta[METADATA_TABLE].extended_description or ''}"
-                ).strip()
-                options = defaultdict(
-                    str,
-                    {
-                        "description": description,
-                        "required": meta[METADATA_TABLE].app_json_required or meta.get("required", False),
-                    },
-                )
-                if (value := meta[modmail.config.METADATA_TABLE].app_json_default) is not None:
+            if meta_tbl.export_to_env_template or required:
+                prefill = meta_tbl.export_environment_prefill or meta["default"]
+                # quoted the same way as dotenv.set_key, which this previously used for every key
+                env_lines.append("{0}='{1}'\n".format(key, prefill.replace("'", "\\'")))
+
+            if meta_tbl.export_to_app_json or meta_tbl.export_to_env_template or required:
+                description = f"{meta_tbl.description}\n{meta_tbl.extended_description or ''}".strip()
+                options = {
+                    "description": description,
+                    "required": meta_tbl.app_json_required or required,
+                }
+                if (value := meta_tbl.app_json_default) is not None:
                     options["value"] = value
                 app_json_env[key] = options
 
+        # the file is rewritten in full to ensure that there are no extra environment variables
+        ENV_EXPORT_FILE.write_text("".join(env_lines), encoding="utf-8")
+
         app_json["env"] = app_json_env
-        with open(APP_JSON_FILE, "w") as f:
-            json.dump(app_json, f, indent=4)
-            f.write("\n")
+        APP_JSON_FILE.write_text(json.dumps(app_json, indent=4) + "\n")
 
     for file, diff in check_file.edited_files.items():
         print(
@@ -16,6 +16,14 @@ def pytest_report_header(config) -> str:
     return "package: modmail"
 
 
+@pytest.fixture(autouse=True, scope="package")
+def configure_logging():
+    """Set up the logging handlers. This is normally run by modmail.__main__, which is not run for testing."""
+    import modmail
+
+    modmail.configure_logging()
+
+
 @pytest.fixture(autouse=True, scope="package")
 def patch_embeds():
     """Run the patch embed method. This is normally run by modmail.__main__, which is not run for testing."""
@@ -1,10 +1,14 @@
 import contextlib
 import io
 import logging
+import os
+import pathlib
+import subprocess
+import sys
 
 import pytest
 
-from modmail.log import ModmailLogger
+from modmail.log import ColourFormatter, ModmailLogger, StderrHandler
 
 
 """
@@ -59,3 +63,72 @@ def test_trace_level(log: ModmailLogger) -> None:
 
     assert "TRACE" in resp
     assert trace_test_phrase in resp
+
+
+def test_colour_formatter() -> None:
+    """Test the colour formatter wraps records in their level's colour."""
+    formatter = ColourFormatter(fmt="%(levelname)s %(message)s")
+    record = logging.LogRecord("test", logging.ERROR, __file__, 0, "Something broke", None, None)
+
+    formatted = formatter.format(record)
+
+    assert formatted == (
+        ColourFormatter.LEVEL_COLOURS[logging.ERROR] + "ERROR Something broke" + ColourFormatter.RESET
+    )
+
+
+def test_stderr_handler_stream_cannot_be_set() -> None:
+    """Test setting the stream of the stderr handler raises a clear error instead of an AttributeError."""
+    handler = StderrHandler()
+
+    with pytest.raises(NotImplementedError):
+        handler.setStream(io.StringIO())
+
+    assert handler.stream is sys.stderr
+
+
+CONFIGURE_LOGGING_SCRIPT = """
+import logging
+import threading
+
+import modmail
+
+root = logging.getLogger()
+assert root.handlers == [], "importing modmail should not add any logging handlers"
+
+modmail.configure_logging()
+handlers = list(root.handlers)
+listener = modmail.log_listener
+threads = threading.active_count()
+assert handlers, "configure_logging should add the logging handlers"
+assert listener is not None, "configure_logging should start the queue listener"
+
+modmail.configure_logging()
+assert root.handlers == handlers, "a second call should not add any more handlers"
+assert modmail.log_listener is listener, "a second call should not create another queue listener"
+assert threading.active_count() == threads, "a second call should not start another thread"
+
+logging.getLogger("modmail.test").warning("Written through the queue listener")
+"""
+
+
+def test_configure_logging(tmp_path: pathlib.Path) -> None:
+    """
+    Logging is only set up by configure_logging, and only once.
+
+    This runs in a fresh interpreter, as the test session has already configured logging.
+    """
+    env = {**os.environ, "MODMAIL_LOGGING_DIRECTORY": str(tmp_path)}
+    result = subprocess.run(
+        [sys.executable, "-c", CONFIGURE_LOGGING_SCRIPT],
+        cwd=pathlib.Path(__file__).parents[2],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+    # errors raised in atexit callbacks, such as stopping the listener, don't change the exit code
+    assert "Traceback" not in result.stderr
+    # the queue listener is drained when it is stopped at exit
+    assert "Written through the queue listener" in (tmp_path / "bot.log").read_text(encoding="utf-8")
@@ -0,0 +1,122 @@
+import os
+import pathlib
+import typing
+
+import pytest
+
+from modmail.utils import plugins
+
+
+PLUGIN_SOURCE = "def setup(bot):\n    pass\n"
+
+
+@pytest.fixture
+def plugin_dir(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
+    """Point the plugin walker at an empty temporary directory, with an empty cache."""
+    monkeypatch.setattr(plugins, "BASE_STR", str(tmp_path))
+    monkeypatch.setattr(plugins, "_WALK_CACHE", dict())
+    return tmp_path
+
+
+def _write_plugin(path: pathlib.Path, source: str = PLUGIN_SOURCE) -> pathlib.Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(source)
+    return path
+
+
+def test_module_names(plugin_dir: pathlib.Path) -> None:
+    """Module names are derived from the relative path, without mangling names ending in `p` or `y`."""
+    _write_plugin(plugin_dir / "apply.py")
+    _write_plugin(plugin_dir / "sub" / "happy.py")
+
+    names: typing.Set[str] = {name for name, _ in plugins.walk_plugins()}
+
+    assert names == {"modmail.plugins.apply", "modmail.plugins.sub.happy"}
+
+
+@pytest.fixture
+def import_calls(monkeypatch: pytest.MonkeyPatch) -> typing.List[str]:
+    """Record the module name of every plugin which is actually imported."""
+    calls = []
+    original = plugins._import_plugin
+
+    def _import_plugin(name: str, path: str) -> typing.Optional[typing.Tuple[str, bool]]:
+        calls.append(name)
+        return original(name, path)
+
+    monkeypatch.setattr(plugins, "_import_plugin", _import_plugin)
+    return calls
+
+
+def test_unchanged_files_are_not_reimported(plugin_dir: pathlib.Path, import_calls: typing.List[str]) -> None:
+    """A second walk uses the cached result for files which have not changed."""
+    _write_plugin(plugin_dir / "cached.py")
+
+    first = list(plugins.walk_plugins())
+    second = list(plugins.walk_plugins())
+
+    assert first == second == [("modmail.plugins.cached", plugins.ExtMetadata.load_if_mode)]
+    assert import_calls == ["modmail.plugins.cached"]
+
+
+@pytest.mark.parametrize("grow", [True, False], ids=["size", "mtime"])
+def test_changed_files_are_reimported(
+    plugin_dir: pathlib.Path, import_calls: typing.List[str], grow: bool
+) -> None:
+    """A change to either the size or the modification time of a file causes it to be imported again."""
+    path = _write_plugin(plugin_dir / "changed.py")
+    list(plugins.walk_plugins())
+
+    st = path.stat()
+    if grow:
+        path.write_text(PLUGIN_SOURCE + "\n# changed\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    else:
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    list(plugins.walk_plugins())
+
+    assert import_calls == ["modmail.plugins.changed"] * 2
+
+
+def test_failed_imports_are_retried(plugin_dir: pathlib.Path, import_calls: typing.List[str]) -> None:
+    """Plugins which fail to import are not cached, so they are attempted again on the next walk."""
+    path = _write_plugin(plugin_dir / "broken.py", "raise ValueError\n")
+
+    assert list(plugins.walk_plugins()) == []
+    assert list(plugins.walk_plugins()) == []
+
+    assert import_calls == ["modmail.plugins.broken"] * 2
+    assert str(path) not in plugins._WALK_CACHE
+
+
+def test_removed_files_are_evicted(plugin_dir: pathlib.Path) -> None:
+    """Files which no longer exist are removed from the cache once a walk completes."""
+    path = _write_plugin(plugin_dir / "removed.py")
+    list(plugins.walk_plugins())
+    assert str(path) in plugins._WALK_CACHE
+
+    path.unlink()
+
+    assert list(plugins.walk_plugins()) == []
+    assert str(path) not in plugins._WALK_CACHE
+
+
+def test_cached_and_fresh_results_keep_scan_order(plugin_dir: pathlib.Path) -> None:
+    """Re-importing some files does not change the order plugins are yielded in."""
+    paths = [_write_plugin(plugin_dir / f"plugin_{i}.py") for i in range(5)]
+    first = list(plugins.walk_plugins())
+
+    paths[2].write_text(PLUGIN_SOURCE + "\n# changed\n")
+    second = list(plugins.walk_plugins())
+
+    assert first == second
+
+
+def test_unreadable_directories_are_skipped(plugin_dir: pathlib.Path) -> None:
+    """A directory which cannot be scanned, such as a symlink loop, does not stop the walk."""
+    _write_plugin(plugin_dir / "looped.py")
+    (plugin_dir / "loop").symlink_to(plugin_dir, target_is_directory=True)
+
+    names = {name for name, _ in plugins.walk_plugins()}
+
+    assert "modmail.plugins.looped" in names